@@ -1,6 +1,11 @@
+import argparse
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ============================================================
 # Interactive Music Library Copier for Navidrome
@@ -9,6 +14,25 @@ import sys
 # to Navidrome music folder structure
 # ============================================================
 
+# Number of rsync processes to run at once
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
+
+# Maximum number of artist folders handed to a single rsync process
+RSYNC_BATCH_SIZE = 32
+
+# rsync timeout per artist folder (seconds)
+RSYNC_TIMEOUT = 3600
+
+# tar record size in 512-byte blocks (2048 = 1 MiB). Large records move
+# many small files through the tar pipe with far fewer read/write calls
+TAR_BLOCKING_FACTOR = 2048
+
+# rsync exit codes meaning "some files were not transferred" rather than failure
+RSYNC_PARTIAL_CODES = (23, 24)
+
+# Directories (by real path) already confirmed writable by a probe write
+_writable_dirs = {}
+
 
 # ============================================================
 # UI/DISPLAY FUNCTIONS
@@ -85,38 +109,46 @@ def validate_is_directory(path):
     return os.path.isdir(path)
 
 
-def validate_writable(path):
-    """Check if directory is writable by attempting to create a temp file."""
+def _probe_write_once(path):
+    """
+    Check if directory is writable by attempting to create a temp file.
+    Successful probes are cached, so each directory is probed at most once.
+    """
+    real_path = os.path.realpath(path)
+    if real_path in _writable_dirs:
+        return True
+
     test_file = os.path.join(path, ".write_test_temp")
     try:
         with open(test_file, 'w') as f:
             f.write("test")
         os.remove(test_file)
-        return True
     except (OSError, PermissionError):
         return False
 
+    _writable_dirs[real_path] = True
+    return True
+
+
+def validate_writable(path):
+    """Check if directory is writable."""
+    # os.access() is a cheap permission check, but it can report success
+    # on SMB/NFS mounts that still refuse writes, so confirm with a probe
+    return os.access(path, os.W_OK) and _probe_write_once(path)
+
 
 def check_rsync_available():
     """
     Check if rsync is available on the system.
     Returns (available: bool, use_wsl: bool)
     """
-    # First try direct rsync
-    try:
-        result = subprocess.run(
-            ['rsync', '--version'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            return (True, False)
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    
+    # First try direct rsync (PATH lookup only, no process started)
+    if shutil.which('rsync'):
+        return (True, False)
+
     # On Windows, try WSL rsync as fallback
-    if sys.platform == 'win32':
+    # (rsync inside WSL can only be checked by running it)
+    if sys.platform == 'win32' and shutil.which('wsl'):
         try:
             result = subprocess.run(
                 ['wsl', 'rsync', '--version'],
@@ -132,6 +164,26 @@ def check_rsync_available():
     return (False, False)
 
 
+def _scan_subdirs(path):
+    """Return os.DirEntry objects for the subdirectories of path."""
+    # DirEntry.is_dir() uses the file type from the directory listing,
+    # so no extra stat() call is needed per entry
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_dir()]
+
+
+def _list_subdirs(path):
+    """Return the names of the subdirectories of path."""
+    return [entry.name for entry in _scan_subdirs(path)]
+
+
+def _has_subdirs(path):
+    """Check if path contains at least one subdirectory."""
+    # any() stops at the first directory instead of listing them all
+    with os.scandir(path) as entries:
+        return any(entry.is_dir() for entry in entries)
+
+
 def convert_to_wsl_path(windows_path):
     """Convert Windows path to WSL path format."""
     # Normalize the path
@@ -191,9 +243,8 @@ def get_input_folder():
 
         # Check if folder contains artist subdirectories
         try:
-            items = os.listdir(path)
             # Look for at least one subdirectory (potential artist folder)
-            has_subdirs = any(os.path.isdir(os.path.join(path, item)) for item in items)
+            has_subdirs = _has_subdirs(path)
             if not has_subdirs:
                 print(f"\n⚠️  Warning: No subdirectories found in: {path}")
                 print("This might not be the correct iTunes music folder.")
@@ -274,21 +325,23 @@ def get_output_folder():
 
 
 def preview_copy_operation(input_folder, output_folder):
-    """Show preview of what will be copied and ask for confirmation."""
+    """
+    Show preview of what will be copied and ask for confirmation.
+    Returns (proceed: bool, quick_mode: bool)
+    """
     print("\n" + "=" * 60)
     print("PREVIEW: Copy Operation")
     print("=" * 60)
 
     try:
         # Get list of artist folders (directories in input folder)
-        items = os.listdir(input_folder)
-        artist_folders = [item for item in items if os.path.isdir(os.path.join(input_folder, item))]
+        artist_folders = _list_subdirs(input_folder)
 
         if not artist_folders:
             print("\n⚠️  Warning: No artist folders found in input directory")
             print("This might not be the correct iTunes music folder.")
             confirm = input("\nProceed anyway? (y/n): ").strip().lower()
-            return confirm == 'y'
+            return (confirm == 'y', False)
 
         total_artists = len(artist_folders)
         print(f"\nFound {total_artists} artist folder(s) to copy")
@@ -308,30 +361,368 @@ def preview_copy_operation(input_folder, output_folder):
         print("  • Files will be preserved (no deletion of existing files)")
         print("  • Only new/changed files will be transferred")
 
+        print("\nQuick resync compares files by size only and skips the")
+        print("timestamp check. Use it for repeat runs, not the first copy.")
+        quick = input("Quick resync? (y/n): ").strip().lower()
+        quick_mode = quick == 'y'
+
         print("\n" + "-" * 60)
         confirm = input("\nProceed with copy? (y/n): ").strip().lower()
-        return confirm == 'y'
+        return (confirm == 'y', quick_mode)
 
     except Exception as e:
         print(f"\n❌ Error reading input folder: {e}")
-        return False
+        return (False, False)
 
 
 # ============================================================
 # COPY FUNCTIONS
 # ============================================================
 
-def copy_artist_folders_rsync(input_folder, output_folder, use_wsl=False):
+def _copy_one_artist(source_path, dest_path, use_wsl=False, quick_mode=False):
+    """
+    Copy a single artist folder using rsync.
+    quick_mode compares files by size only (--size-only).
+    Returns (artist, status, error_msg) - status is None on error.
+    """
+    artist_folder = os.path.basename(source_path)
+
+    # Check if destination already exists
+    dest_exists = os.path.exists(dest_path)
+
+    try:
+        # Build rsync command
+        # -a: archive mode (preserves permissions, timestamps, etc.)
+        # (no -v: per-file output would only be captured and discarded)
+        # --whole-file: copy changed files outright, no delta checksums
+        # --partial: keep partial files on interruption
+        # --human-readable: human-readable sizes
+        # Trailing slash on source means copy contents of folder, not folder itself
+
+        if use_wsl:
+            # Convert Windows paths to WSL paths
+            source_wsl = convert_to_wsl_path(source_path) + '/'
+            dest_wsl = convert_to_wsl_path(dest_path)
+            rsync_cmd = [
+                'wsl',
+                'rsync',
+                '-a',
+                '--whole-file',
+                '--partial',
+                '--human-readable',
+                source_wsl,
+                dest_wsl
+            ]
+        else:
+            rsync_cmd = [
+                'rsync',
+                '-a',
+                '--whole-file',
+                '--partial',
+                '--human-readable',
+                source_path + os.sep,  # Trailing slash means copy contents
+                dest_path
+            ]
+
+        if quick_mode:
+            # Skip the modification-time check for files of equal size
+            rsync_cmd.insert(-2, '--size-only')
+
+        # Run rsync (discard stdout for cleaner output, capture stderr for errors)
+        proc = subprocess.Popen(
+            rsync_cmd,
+            stdout=subprocess.DEVNULL,  # Nothing to buffer or drain
+            stderr=subprocess.PIPE,  # Capture errors
+            text=True
+        )
+        try:
+            _, stderr = proc.communicate(timeout=RSYNC_TIMEOUT)  # 1 hour timeout per artist
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return (artist_folder, None, "Timeout (exceeded 1 hour)")
+
+        if proc.returncode == 0:
+            # Rsync handles incremental updates automatically
+            # If destination exists, it's an update; otherwise it's a new copy
+            status = "Updated" if dest_exists else "Copied"
+            return (artist_folder, status, None)
+
+        return (artist_folder, None, stderr.strip() or "rsync failed")
+
+    except Exception as e:
+        return (artist_folder, None, str(e))
+
+
+def _attribute_errors(error_output, artist_folders, roots):
+    """
+    Match error lines from rsync/tar to the artist folders they mention.
+    A line belongs to an artist when the path component right after one of
+    `roots` (or after a quoted or ./ relative path) is the artist folder.
+    Returns (artist_errors: dict of artist -> [lines], general_errors: list)
+    """
+    anchors = [re.escape(root.replace('\\', '/').rstrip('/')) + '/' for root in roots]
+    anchors += ['"', r'(?<![^\s\'"])\./']
+    path_pattern = re.compile('(?:' + '|'.join(anchors) + r')(?:\./)*([^/"\':]+)')
+    artists = set(artist_folders)
+
+    artist_errors = {}
+    general_errors = []
+    for line in error_output.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        normalized = line.replace('\\', '/')
+        for match in path_pattern.finditer(normalized):
+            if match.group(1) in artists:
+                artist_errors.setdefault(match.group(1), []).append(line)
+                break
+        else:
+            general_errors.append(line)
+    return artist_errors, general_errors
+
+
+def _tar_copy_artists(input_folder, output_folder, artist_folders):
+    """
+    Copy artist folders that do not exist in the destination yet, using a
+    `tar -c | tar -x` pipeline. A first-time copy moves every byte anyway,
+    so this skips rsync's per-file comparison work entirely.
+    Returns a list of (artist, status, error_msg) - status is None on error.
+    """
+    timeout = RSYNC_TIMEOUT * len(artist_folders)
+
+    # ./ prefix keeps folder names starting with '-' from being read as options
+    members = ['./' + artist for artist in artist_folders]
+
+    try:
+        # Reader errors go to a temp file: a full stderr pipe would stall
+        # the reader while we wait on the writer
+        with tempfile.TemporaryFile() as reader_errors:
+            reader = subprocess.Popen(
+                ['tar', '-C', input_folder, '-b', str(TAR_BLOCKING_FACTOR), '-cf', '-'] + members,
+                stdout=subprocess.PIPE,
+                stderr=reader_errors
+            )
+            writer = subprocess.Popen(
+                ['tar', '-C', output_folder, '-b', str(TAR_BLOCKING_FACTOR), '-xpf', '-'],
+                stdin=reader.stdout,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            # Only the writer reads the pipe now; lets the reader see
+            # SIGPIPE if the writer exits early
+            reader.stdout.close()
+
+            try:
+                _, writer_stderr = writer.communicate(timeout=timeout)
+                reader.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                reader.kill()
+                writer.kill()
+                reader.wait()
+                writer.communicate()
+                return [(artist, None, "Timeout (tar copy did not finish)") for artist in artist_folders]
+
+            reader_errors.seek(0)
+            error_output = (
+                reader_errors.read().decode('utf-8', 'replace') + '\n'
+                + writer_stderr.decode('utf-8', 'replace')
+            )
+    except Exception as e:
+        return [(artist, None, str(e)) for artist in artist_folders]
+
+    if reader.returncode == 0 and writer.returncode == 0:
+        return [(artist, "Copied", None) for artist in artist_folders]
+
+    # tar keeps going after per-file errors, so artists not mentioned in
+    # the error output were copied - unless some error named no artist
+    artist_errors, general_errors = _attribute_errors(
+        error_output, artist_folders, (input_folder, output_folder)
+    )
+    unattributed = [line for line in general_errors if not line.startswith('tar: Exiting')]
+    results = []
+    for artist in artist_folders:
+        if artist in artist_errors:
+            results.append((artist, None, "; ".join(artist_errors[artist])))
+        elif unattributed or not artist_errors:
+            results.append((artist, None, "; ".join(general_errors) or "tar failed"))
+        else:
+            results.append((artist, "Copied", None))
+
+    return results
+
+
+def _rsync_artist_batch(input_folder, output_folder, artist_entries, use_wsl=False, quick_mode=False):
+    """
+    Copy several artist folders (os.DirEntry objects) with a single rsync process.
+    The folder names are fed to rsync through --files-from, so one process
+    and one file-list scan cover the whole batch.
+    Returns a list of (artist, status, error_msg) - status is None on error.
+    """
+    if len(artist_entries) == 1:
+        entry = artist_entries[0]
+        return [_copy_one_artist(
+            entry.path,
+            os.path.join(output_folder, entry.name),
+            use_wsl,
+            quick_mode
+        )]
+
+    artist_folders = [entry.name for entry in artist_entries]
+
+    # Check which destinations already exist before rsync creates them
+    dest_exists = {
+        artist: os.path.exists(os.path.join(output_folder, artist))
+        for artist in artist_folders
+    }
+
+    # Build rsync command
+    # -a: archive mode (does not imply -r together with --files-from)
+    # -r: recurse into the listed artist folders
+    # --whole-file: copy changed files outright, no delta checksums
+    # --out-format=%n: print the relative path of each transferred file
+    #   (--info=name1 would need rsync 3.1+; macOS ships 2.6.9)
+    # --files-from=- --from0: read NUL-separated folder names from stdin
+    if use_wsl:
+        source_root = convert_to_wsl_path(input_folder) + '/'
+        dest_root = convert_to_wsl_path(output_folder)
+        rsync_cmd = ['wsl', 'rsync']
+    else:
+        source_root = input_folder + os.sep
+        dest_root = output_folder
+        rsync_cmd = ['rsync']
+    rsync_cmd += [
+        '-a',
+        '-r',
+        '--whole-file',
+        '--partial',
+        '--human-readable',
+        '--out-format=%n',
+        '--files-from=-',
+        '--from0',
+        source_root,
+        dest_root
+    ]
+    if quick_mode:
+        # Skip the modification-time check for files of equal size
+        rsync_cmd.insert(-2, '--size-only')
+
+    # Folder names go over stdin as raw bytes, so names that aren't valid
+    # UTF-8 (surrogate-escaped by os.scandir) reach rsync unchanged
+    file_list = b'\0'.join(os.fsencode(artist) for artist in artist_folders) + b'\0'
+
+    proc = None
+    try:
+        proc = subprocess.Popen(
+            rsync_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        try:
+            stdout, stderr = proc.communicate(
+                file_list,
+                timeout=RSYNC_TIMEOUT * len(artist_folders)
+            )
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return [(artist, None, "Timeout (rsync batch did not finish)") for artist in artist_folders]
+    except Exception as e:
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+        return [(artist, None, str(e)) for artist in artist_folders]
+
+    stdout = stdout.decode('utf-8', 'surrogateescape')
+    stderr = stderr.decode('utf-8', 'surrogateescape')
+
+    # Count transferred files per artist (first path component)
+    transferred = dict.fromkeys(artist_folders, 0)
+    for line in stdout.splitlines():
+        if not line or line.endswith('/'):
+            continue
+        artist = line.split('/', 1)[0]
+        if artist in transferred:
+            transferred[artist] += 1
+
+    # Attribute rsync error lines to the artist folders they mention
+    artist_errors, general_errors = _attribute_errors(
+        stderr, artist_folders, (source_root, dest_root)
+    )
+
+    # A partial transfer only clears the other artists when every error
+    # line (apart from rsync's closing exit-code summary) could be attributed
+    unattributed = [
+        line for line in general_errors
+        if not line.startswith(('rsync error:', 'rsync warning:'))
+    ]
+    batch_failed = proc.returncode != 0 and (
+        proc.returncode not in RSYNC_PARTIAL_CODES or unattributed
+    )
+
+    results = []
+    for artist in artist_folders:
+        if artist in artist_errors:
+            results.append((artist, None, "; ".join(artist_errors[artist])))
+        elif batch_failed:
+            results.append((artist, None, "; ".join(general_errors) or "rsync failed"))
+        elif not dest_exists[artist]:
+            results.append((artist, "Copied", None))
+        elif transferred[artist]:
+            results.append((artist, "Updated", None))
+        else:
+            results.append((artist, "Up to date", None))
+
+    return results
+
+
+def _copy_artist_batch(input_folder, output_folder, artist_entries, use_wsl=False, quick_mode=False):
+    """
+    Copy a batch of artist folders (os.DirEntry objects).
+    Folders missing from the destination are copied with tar when it is
+    available; folders that already exist are updated with rsync.
+    Returns a list of (artist, status, error_msg) - status is None on error.
+    """
+    # tar and the --files-from batch would copy a symlinked artist folder
+    # as a bare link, so those are copied on their own through the link
+    results = [
+        _copy_one_artist(entry.path, os.path.join(output_folder, entry.name), use_wsl, quick_mode)
+        for entry in artist_entries
+        if entry.is_symlink()
+    ]
+    artist_entries = [entry for entry in artist_entries if not entry.is_symlink()]
+
+    if not use_wsl and shutil.which('tar'):
+        new_entries = [
+            entry for entry in artist_entries
+            if not os.path.exists(os.path.join(output_folder, entry.name))
+        ]
+        if new_entries:
+            results += _tar_copy_artists(
+                input_folder, output_folder, [entry.name for entry in new_entries]
+            )
+            artist_entries = [entry for entry in artist_entries if entry not in new_entries]
+
+    if artist_entries:
+        results += _rsync_artist_batch(input_folder, output_folder, artist_entries, use_wsl, quick_mode)
+
+    return results
+
+
+def copy_artist_folders_rsync(input_folder, output_folder, use_wsl=False, jobs=DEFAULT_JOBS,
+                              quick_mode=False):
     """
     Copy artist folders from input to output using rsync.
+    Artist folders are copied in batches, with up to `jobs` rsync
+    processes running at once. quick_mode compares files by size only.
     Returns (copied_count, skipped_count, errors_list)
     """
     try:
-        # Get list of artist folders
-        items = os.listdir(input_folder)
-        artist_folders = [item for item in items if os.path.isdir(os.path.join(input_folder, item))]
+        # Get list of artist folders (entries carry their full source path)
+        artist_entries = _scan_subdirs(input_folder)
 
-        if not artist_folders:
+        if not artist_entries:
             print("\n❌ No artist folders found in input directory")
             return (0, 0, [])
 
@@ -342,77 +733,40 @@ def copy_artist_folders_rsync(input_folder, output_folder, use_wsl=False):
         copied_count = 0
         skipped_count = 0
         errors = []
-        total_artists = len(artist_folders)
-
-        for idx, artist_folder in enumerate(artist_folders, 1):
-            source_path = os.path.join(input_folder, artist_folder)
-            dest_path = os.path.join(output_folder, artist_folder)
-
-            # Calculate percentage
-            percentage = int((idx / total_artists) * 100)
-
-            # Check if destination already exists
-            dest_exists = os.path.exists(dest_path)
-
-            try:
-                # Build rsync command
-                # -a: archive mode (preserves permissions, timestamps, etc.)
-                # -v: verbose (one line per file)
-                # --partial: keep partial files on interruption
-                # --human-readable: human-readable sizes
-                # Trailing slash on source means copy contents of folder, not folder itself
-                
-                if use_wsl:
-                    # Convert Windows paths to WSL paths
-                    source_wsl = convert_to_wsl_path(source_path) + '/'
-                    dest_wsl = convert_to_wsl_path(dest_path)
-                    rsync_cmd = [
-                        'wsl',
-                        'rsync',
-                        '-av',
-                        '--partial',
-                        '--human-readable',
-                        source_wsl,
-                        dest_wsl
-                    ]
-                else:
-                    rsync_cmd = [
-                        'rsync',
-                        '-av',
-                        '--partial',
-                        '--human-readable',
-                        source_path + os.sep,  # Trailing slash means copy contents
-                        dest_path
-                    ]
-
-                # Run rsync (suppress stdout for cleaner output, stderr for errors)
-                result = subprocess.run(
-                    rsync_cmd,
-                    stdout=subprocess.PIPE,  # Capture but don't display
-                    stderr=subprocess.PIPE,  # Capture errors
-                    text=True,
-                    timeout=3600  # 1 hour timeout per artist
+        total_artists = len(artist_entries)
+
+        # Split artists into batches - one rsync process per batch, with
+        # enough batches to keep all jobs busy
+        batch_size = min(RSYNC_BATCH_SIZE, (total_artists + jobs - 1) // jobs)
+        batches = [
+            artist_entries[i:i + batch_size]
+            for i in range(0, total_artists, batch_size)
+        ]
+
+        # Each rsync is its own process, so threads only wait on them
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    _copy_artist_batch, input_folder, output_folder, batch, use_wsl, quick_mode
                 )
+                for batch in batches
+            ]
 
-                if result.returncode == 0:
-                    # Rsync handles incremental updates automatically
-                    # If destination exists, it's an update; otherwise it's a new copy
-                    status = "Updated" if dest_exists else "Copied"
-                    print(f"[{idx}/{total_artists}] ({percentage}%) {artist_folder} ... ✅ {status}")
-                    copied_count += 1
-                else:
-                    error_msg = result.stderr.strip() or "rsync failed"
-                    print(f"[{idx}/{total_artists}] ({percentage}%) {artist_folder} ... ❌ ERROR: {error_msg}")
-                    errors.append((artist_folder, error_msg))
+            idx = 0
+            for future in as_completed(futures):
+                for artist_folder, status, error_msg in future.result():
+                    idx += 1
 
-            except subprocess.TimeoutExpired:
-                error_msg = "Timeout (exceeded 1 hour)"
-                print(f"[{idx}/{total_artists}] ({percentage}%) {artist_folder} ... ❌ ERROR: {error_msg}")
-                errors.append((artist_folder, error_msg))
-            except Exception as e:
-                error_msg = str(e)
-                print(f"[{idx}/{total_artists}] ({percentage}%) {artist_folder} ... ❌ ERROR: {error_msg}")
-                errors.append((artist_folder, error_msg))
+                    # Calculate percentage
+                    percentage = int((idx / total_artists) * 100)
+
+                    # Results are drained here, so progress lines never interleave
+                    if status:
+                        print(f"[{idx}/{total_artists}] ({percentage}%) {artist_folder} ... ✅ {status}")
+                        copied_count += 1
+                    else:
+                        print(f"[{idx}/{total_artists}] ({percentage}%) {artist_folder} ... ❌ ERROR: {error_msg}")
+                        errors.append((artist_folder, error_msg))
 
         return (copied_count, skipped_count, errors)
 
@@ -425,8 +779,28 @@ def copy_artist_folders_rsync(input_folder, output_folder, use_wsl=False):
 # MAIN WORKFLOW
 # ============================================================
 
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(
+        description="Copy artist folders from an iTunes library to Navidrome using rsync."
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar='N',
+        help=f"number of rsync processes to run in parallel (default: {DEFAULT_JOBS})"
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
 def main():
     """Main interactive workflow."""
+    args = parse_args()
+
     try:
         # Welcome message
         print_welcome()
@@ -462,13 +836,14 @@ def main():
             return
 
         # Step 3: Preview and confirm
-        if not preview_copy_operation(input_folder, output_folder):
+        proceed, quick_mode = preview_copy_operation(input_folder, output_folder)
+        if not proceed:
             print("\n❌ Cancelled by user")
             return
 
         # Step 4: Execute copy
         copied_count, skipped_count, errors = copy_artist_folders_rsync(
-            input_folder, output_folder, use_wsl
+            input_folder, output_folder, use_wsl, args.jobs, quick_mode
         )
 
         # Display summary
@@ -1,7 +1,9 @@
 import os
+import plistlib
 import sys
-import xml.etree.ElementTree as ET
-from urllib.parse import unquote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import unquote_to_bytes
+from xml.parsers.expat import ExpatError
 import re
 
 # ============================================================
@@ -11,50 +13,8 @@ import re
 # Use this if you don't have iTunes installed or have many playlists
 # ============================================================
 
-
-def parse_plist_dict(element):
-    """Parse a plist <dict> element into a Python dictionary."""
-    result = {}
-    children = list(element)
-
-    i = 0
-    while i < len(children):
-        if children[i].tag == 'key':
-            key = children[i].text
-            i += 1
-            if i < len(children):
-                value = parse_plist_value(children[i])
-                result[key] = value
-        i += 1
-
-    return result
-
-
-def parse_plist_array(element):
-    """Parse a plist <array> element into a Python list."""
-    return [parse_plist_value(child) for child in element]
-
-
-def parse_plist_value(element):
-    """Parse a plist value element and return the appropriate Python type."""
-    if element.tag == 'dict':
-        return parse_plist_dict(element)
-    elif element.tag == 'array':
-        return parse_plist_array(element)
-    elif element.tag == 'string':
-        return element.text if element.text else ''
-    elif element.tag == 'integer':
-        return int(element.text) if element.text else 0
-    elif element.tag == 'true':
-        return True
-    elif element.tag == 'false':
-        return False
-    elif element.tag == 'date':
-        return element.text if element.text else ''
-    elif element.tag == 'data':
-        return element.text if element.text else ''
-    else:
-        return None
+# Characters not allowed in filenames, mapped to '_'
+INVALID_CHARS_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
 
 
 def decode_file_url(url):
@@ -63,15 +23,17 @@ def decode_file_url(url):
         return None
 
     # Remove file:// prefix
-    if url.startswith('file://'):
-        url = url[7:]
+    path = url.removeprefix('file://')
 
-    # URL decode
-    path = unquote(url)
+    # URL decode (most paths have no escapes at all); decoding the bytes in
+    # one go is faster than unquote()'s per-escape handling.
+    # Not memoized: each track has a unique URL, and caching the decoded
+    # directory part measured slower than decoding the whole path directly.
+    if '%' in path:
+        path = unquote_to_bytes(path).decode('utf-8', 'replace')
 
     # Handle localhost prefix
-    if path.startswith('localhost/'):
-        path = path[10:]
+    path = path.removeprefix('localhost/')
 
     # Convert forward slashes to backslashes on Windows if needed
     # For now, keep forward slashes as the converter script handles this
@@ -79,8 +41,29 @@ def decode_file_url(url):
     return path
 
 
-def extract_tracks(library_dict):
-    """Extract track information from iTunes library."""
+def is_user_playlist(playlist_info):
+    """Check if a playlist is a user playlist (not a special iTunes playlist)."""
+    return not playlist_info.get('Master') and not playlist_info.get('Distinguished Kind')
+
+
+def find_referenced_track_ids(library_dict):
+    """Return the set of track IDs used by user playlists."""
+    return {
+        str(item['Track ID'])
+        for playlist_info in library_dict.get('Playlists', [])
+        if is_user_playlist(playlist_info)
+        for item in playlist_info.get('Playlist Items', [])
+        if 'Track ID' in item
+    }
+
+
+def extract_tracks(library_dict, referenced=None):
+    """
+    Extract track information from iTunes library.
+    If referenced is given, only those track IDs are extracted.
+    Returns the library's own track dictionaries (keyed by track ID),
+    with the decoded file path added under '_location'.
+    """
     tracks = {}
 
     if 'Tracks' not in library_dict:
@@ -89,16 +72,12 @@ def extract_tracks(library_dict):
     tracks_dict = library_dict['Tracks']
 
     for track_id, track_info in tracks_dict.items():
-        if 'Location' in track_info:
-            location = decode_file_url(track_info['Location'])
-            if location:
-                tracks[track_id] = {
-                    'location': location,
-                    'name': track_info.get('Name', ''),
-                    'artist': track_info.get('Artist', ''),
-                    'album': track_info.get('Album', ''),
-                    'total_time': track_info.get('Total Time', 0)
-                }
+        if referenced is not None and track_id not in referenced:
+            continue
+        location = decode_file_url(track_info.get('Location'))
+        if location:
+            track_info['_location'] = location
+            tracks[track_id] = track_info
 
     return tracks
 
@@ -112,11 +91,12 @@ def extract_playlists(library_dict, tracks):
 
     playlists_array = library_dict['Playlists']
 
+    # Bound once outside the loops - called once per playlist entry
+    get_track = tracks.get
+
     for playlist_info in playlists_array:
         # Skip special iTunes playlists
-        if playlist_info.get('Master'):
-            continue
-        if playlist_info.get('Distinguished Kind'):
+        if not is_user_playlist(playlist_info):
             continue
 
         # Get playlist name
@@ -129,15 +109,15 @@ def extract_playlists(library_dict, tracks):
         # Extract track locations
         track_locations = []
         for item in playlist_info['Playlist Items']:
-            track_id = str(item.get('Track ID', ''))
-            if track_id in tracks:
-                track_data = tracks[track_id]
-                track_locations.append({
-                    'location': track_data['location'],
-                    'name': track_data['name'],
-                    'artist': track_data['artist'],
-                    'total_time': track_data['total_time']
-                })
+            track_data = get_track(str(item.get('Track ID', '')))
+            if track_data is None:
+                continue
+            track_locations.append({
+                'location': track_data['_location'],
+                'name': track_data.get('Name', ''),
+                'artist': track_data.get('Artist', ''),
+                'total_time': track_data.get('Total Time', 0)
+            })
 
         if track_locations:
             playlists.append({
@@ -150,10 +130,8 @@ def extract_playlists(library_dict, tracks):
 
 def sanitize_filename(filename):
     """Sanitize playlist name for use as filename."""
-    # Replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters (single pass)
+    filename = filename.translate(INVALID_CHARS_TABLE)
 
     # Remove leading/trailing spaces and periods
     filename = filename.strip('. ')
@@ -172,22 +150,23 @@ def write_m3u_playlist(playlist, output_folder):
     output_path = os.path.join(output_folder, f"{safe_name}.m3u")
 
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Write M3U header
-            f.write('#EXTM3U\n')
+        # Build the whole file in memory, then encode and write it once
+        # M3U header
+        parts = ['#EXTM3U\n']
 
-            # Write each track
-            for track in playlist['tracks']:
-                # Write extended info line
-                # Format: #EXTINF:duration_in_seconds,Artist - Track Name
-                duration_seconds = track['total_time'] // 1000 if track['total_time'] else -1
-                artist = track['artist'] if track['artist'] else 'Unknown Artist'
-                name = track['name'] if track['name'] else 'Unknown Track'
+        for track in playlist['tracks']:
+            # Extended info line
+            # Format: #EXTINF:duration_in_seconds,Artist - Track Name
+            total_time = track['total_time']
+            duration_seconds = total_time // 1000 if total_time else -1
+            artist = track['artist'] or 'Unknown Artist'
+            name = track['name'] or 'Unknown Track'
 
-                f.write(f"#EXTINF:{duration_seconds},{artist} - {name}\n")
+            # Followed by the file path
+            parts.append(f"#EXTINF:{duration_seconds},{artist} - {name}\n{track['location']}\n")
 
-                # Write file path
-                f.write(f"{track['location']}\n")
+        with open(output_path, 'wb') as f:
+            f.write(''.join(parts).encode('utf-8'))
 
         return True, len(playlist['tracks'])
 
@@ -195,30 +174,36 @@ def write_m3u_playlist(playlist, output_folder):
         return False, str(e)
 
 
+def write_m3u_playlist_group(playlists, output_folder):
+    """
+    Write playlists that map to the same filename, one after another.
+    Keeps the "last playlist wins" result without concurrent writes to one file.
+    Returns a list of (playlist_name, success, result)
+    """
+    return [
+        (playlist['name'], *write_m3u_playlist(playlist, output_folder))
+        for playlist in playlists
+    ]
+
+
 def parse_itunes_library(xml_path):
     """Parse iTunes Library.xml file."""
     print(f"\nParsing iTunes Library.xml...")
     print(f"Path: {xml_path}\n")
 
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
         # iTunes library XML is a plist format
         # Structure: <plist><dict>...</dict></plist>
-        plist_dict = None
-        for child in root:
-            if child.tag == 'dict':
-                plist_dict = parse_plist_dict(child)
-                break
+        with open(xml_path, 'rb') as f:
+            plist_dict = plistlib.load(f, fmt=plistlib.FMT_XML)
 
-        if not plist_dict:
+        if not plist_dict or not isinstance(plist_dict, dict):
             print("❌ Error: Could not find library dictionary in XML")
             return None
 
         return plist_dict
 
-    except ET.ParseError as e:
+    except (plistlib.InvalidFileException, ExpatError) as e:
         print(f"❌ Error parsing XML file: {e}")
         return None
     except Exception as e:
@@ -265,10 +250,11 @@ def main():
         if not library_dict:
             return
 
-        # Step 3: Extract tracks
+        # Step 3: Extract tracks (only those used by user playlists)
         print("Extracting track information...")
-        tracks = extract_tracks(library_dict)
-        print(f"✅ Found {len(tracks)} tracks")
+        referenced = find_referenced_track_ids(library_dict)
+        tracks = extract_tracks(library_dict, referenced)
+        print(f"✅ Found {len(tracks)} tracks in user playlists")
 
         # Step 4: Extract playlists
         print("Extracting playlists...")
@@ -325,21 +311,36 @@ def main():
         error_count = 0
         errors = []
 
-        for i, playlist in enumerate(playlists, 1):
-            playlist_name = playlist['name']
-            percentage = int((i / len(playlists)) * 100)
-
-            success, result = write_m3u_playlist(playlist, output_folder)
-
-            if success:
-                track_count = result
-                print(f"[{i}/{len(playlists)}] ({percentage}%) {playlist_name} ... ✅ {track_count} tracks")
-                success_count += 1
-            else:
-                error_msg = result
-                print(f"[{i}/{len(playlists)}] ({percentage}%) {playlist_name} ... ❌ ERROR: {error_msg}")
-                error_count += 1
-                errors.append((playlist_name, error_msg))
+        # Group playlists by output filename (case-insensitive filesystems
+        # treat "Jazz" and "jazz" as the same file)
+        groups = {}
+        for playlist in playlists:
+            key = sanitize_filename(playlist['name']).lower()
+            groups.setdefault(key, []).append(playlist)
+
+        # Write files concurrently - each write mostly waits on the filesystem
+        total_playlists = len(playlists)
+        i = 0
+        with ThreadPoolExecutor(max_workers=min(32, len(groups))) as executor:
+            futures = [
+                executor.submit(write_m3u_playlist_group, group, output_folder)
+                for group in groups.values()
+            ]
+
+            for future in as_completed(futures):
+                for playlist_name, success, result in future.result():
+                    i += 1
+                    percentage = int((i / total_playlists) * 100)
+
+                    if success:
+                        track_count = result
+                        print(f"[{i}/{total_playlists}] ({percentage}%) {playlist_name} ... ✅ {track_count} tracks")
+                        success_count += 1
+                    else:
+                        error_msg = result
+                        print(f"[{i}/{total_playlists}] ({percentage}%) {playlist_name} ... ❌ ERROR: {error_msg}")
+                        error_count += 1
+                        errors.append((playlist_name, error_msg))
 
         # Summary
         print("\n" + "=" * 60)